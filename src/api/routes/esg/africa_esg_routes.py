@@ -24,6 +24,27 @@ logger = logging.getLogger(__name__)
 # Create the Africa ESG blueprint
 africa_esg_bp = Blueprint('africa_esg', __name__, url_prefix='/api/esg/africa')
 
+
+def _format_dates(df):
+    """
+    Format a datetime64 date column to YYYY-MM-DD strings for serialization
+
+    Dates stay native (datetime64) inside the fetchers; this is the edge
+    where they become strings, so jsonify/to_json never fall back to
+    RFC-822 or epoch-millisecond renderings.
+
+    Args:
+        df (pandas.DataFrame): DataFrame that may carry a 'date' column
+
+    Returns:
+        pandas.DataFrame: Frame with the date column stringified
+    """
+    if 'date' in df.columns and pd.api.types.is_datetime64_any_dtype(df['date']):
+        df = df.copy()
+        df['date'] = df['date'].dt.strftime('%Y-%m-%d')
+    return df
+
+
 @africa_esg_bp.route('/')
 def africa_esg_index():
     """Africa ESG API index endpoint"""
@@ -141,7 +162,7 @@ def get_african_environmental_metrics():
         
         # Convert DataFrame to records
         if not df.empty:
-            metrics = df.to_dict(orient='records')
+            metrics = _format_dates(df).to_dict(orient='records')
             
             loop.close()
             
@@ -229,7 +250,7 @@ def get_african_social_metrics():
         
         # Convert DataFrame to records
         if not df.empty:
-            metrics = df.to_dict(orient='records')
+            metrics = _format_dates(df).to_dict(orient='records')
             
             loop.close()
             
@@ -317,7 +338,7 @@ def get_african_governance_metrics():
         
         # Convert DataFrame to records
         if not df.empty:
-            metrics = df.to_dict(orient='records')
+            metrics = _format_dates(df).to_dict(orient='records')
             
             loop.close()
             
@@ -405,7 +426,7 @@ def get_african_infrastructure_metrics():
         
         # Convert DataFrame to records
         if not df.empty:
-            metrics = df.to_dict(orient='records')
+            metrics = _format_dates(df).to_dict(orient='records')
             
             loop.close()
             
@@ -538,6 +559,11 @@ def compare_african_regions():
         # Fetch comparative analysis
         df = loop.run_until_complete(fetcher.fetch_comparative_analysis(region_codes, dimension, metrics, date))
         
+        # Stringify dates before any serialization so JSON exports don't
+        # emit epoch milliseconds
+        if not df.empty:
+            df = _format_dates(df)
+
         # If export format is specified, export data
         if export_format in ['json', 'csv']:
             # Setup output path
@@ -568,7 +594,7 @@ def compare_african_regions():
         
         # Convert DataFrame to records
         if not df.empty:
-            results = df.to_dict(orient='records')
+            results = _format_dates(df).to_dict(orient='records')
             
             loop.close()
             
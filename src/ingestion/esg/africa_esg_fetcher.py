@@ -11,7 +11,9 @@ import asyncio
 import json
 import aiohttp
 import pandas as pd
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime, date, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 from .base_esg_fetcher import BaseESGFetcher
@@ -20,6 +22,328 @@ from models import Region, EnvironmentalMetric, SocialMetric, GovernanceMetric,
 # Configure logging
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1024)
+def _parse_date(value):
+    """
+    Parse a YYYY-MM-DD string into a date, memoized
+
+    Ingests repeat a small set of distinct date strings, so caching the
+    parse avoids paying for it on every row.
+
+    Args:
+        value (str): Date string in YYYY-MM-DD format
+
+    Returns:
+        date: Parsed date
+    """
+    return date.fromisoformat(value)
+
+
+def _parse_date_or(days_back, value):
+    """
+    Parse an ISO date string, with a default relative to today
+
+    Uses date.fromisoformat, which is implemented in C and much cheaper
+    than the strptime format-string machinery.
+
+    Args:
+        days_back (int, optional): Days before today to default to when value is None
+        value (str, optional): Date string in YYYY-MM-DD format
+
+    Returns:
+        date: Parsed date
+    """
+    if value:
+        return date.fromisoformat(value)
+    if days_back:
+        return date.today() - timedelta(days=days_back)
+    return date.today()
+
+
+# Demo seed data used by AfricaESGFetcher.seed_demo_data, hoisted to
+# module scope so repeated seeding does not rebuild the literal dicts
+# on every call
+_DEMO_REGIONS = [
+    {
+        "name": "South Africa",
+        "code": "ZA",
+        "region_type": "country",
+        "parent_id": None,
+        "country": "South Africa",
+        "population": 59308690,
+        "area_km2": 1221037
+    },
+    {
+        "name": "Gauteng",
+        "code": "ZA-GT",
+        "region_type": "province",
+        "parent_id": 1,
+        "country": "South Africa",
+        "population": 15488137,
+        "area_km2": 18178
+    },
+    {
+        "name": "City of Johannesburg",
+        "code": "ZA-GT-JHB",
+        "region_type": "municipality",
+        "parent_id": 2,
+        "country": "South Africa",
+        "population": 5738535,
+        "area_km2": 1645
+    },
+    {
+        "name": "Kenya",
+        "code": "KE",
+        "region_type": "country",
+        "parent_id": None,
+        "country": "Kenya",
+        "population": 53771296,
+        "area_km2": 580367
+    },
+    {
+        "name": "Nairobi",
+        "code": "KE-NB",
+        "region_type": "province",
+        "parent_id": 4,
+        "country": "Kenya",
+        "population": 4397073,
+        "area_km2": 696
+    }
+]
+
+_DEMO_ENVIRONMENTAL_METRICS = [
+    {
+        "region_code": "ZA-GT",
+        "metric_type": "electricity_access",
+        "value": 87.5,
+        "unit": "%",
+        "date": "2023-01-15",
+        "confidence": 0.95
+    },
+    {
+        "region_code": "ZA-GT",
+        "metric_type": "water_access",
+        "value": 92.1,
+        "unit": "%",
+        "date": "2023-02-10",
+        "confidence": 0.92
+    },
+    {
+        "region_code": "ZA-GT",
+        "metric_type": "air_quality_index",
+        "value": 65.4,
+        "unit": "AQI",
+        "date": "2023-03-05",
+        "confidence": 0.88
+    },
+    {
+        "region_code": "KE-NB",
+        "metric_type": "electricity_access",
+        "value": 75.8,
+        "unit": "%",
+        "date": "2023-01-10",
+        "confidence": 0.93
+    },
+    {
+        "region_code": "KE-NB",
+        "metric_type": "water_access",
+        "value": 83.2,
+        "unit": "%",
+        "date": "2023-02-05",
+        "confidence": 0.91
+    },
+    {
+        "region_code": "KE-NB",
+        "metric_type": "air_quality_index",
+        "value": 72.3,
+        "unit": "AQI",
+        "date": "2023-03-01",
+        "confidence": 0.87
+    }
+]
+
+_DEMO_SOCIAL_METRICS = [
+    {
+        "region_code": "ZA-GT",
+        "metric_type": "literacy_rate",
+        "value": 91.2,
+        "unit": "%",
+        "date": "2023-01-20",
+        "confidence": 0.93
+    },
+    {
+        "region_code": "ZA-GT",
+        "metric_type": "healthcare_access",
+        "value": 78.5,
+        "unit": "%",
+        "date": "2023-02-15",
+        "confidence": 0.90
+    },
+    {
+        "region_code": "ZA-GT",
+        "metric_type": "employment_rate",
+        "value": 65.8,
+        "unit": "%",
+        "date": "2023-03-10",
+        "confidence": 0.89
+    },
+    {
+        "region_code": "KE-NB",
+        "metric_type": "literacy_rate",
+        "value": 87.5,
+        "unit": "%",
+        "date": "2023-01-22",
+        "confidence": 0.92
+    },
+    {
+        "region_code": "KE-NB",
+        "metric_type": "healthcare_access",
+        "value": 72.3,
+        "unit": "%",
+        "date": "2023-02-18",
+        "confidence": 0.89
+    },
+    {
+        "region_code": "KE-NB",
+        "metric_type": "employment_rate",
+        "value": 61.2,
+        "unit": "%",
+        "date": "2023-03-12",
+        "confidence": 0.87
+    }
+]
+
+_DEMO_GOVERNANCE_METRICS = [
+    {
+        "region_code": "ZA-GT",
+        "metric_type": "audit_outcome",
+        "value": 82.0,
+        "status": "Unqualified",
+        "unit": "score",
+        "date": "2023-01-25",
+        "confidence": 0.94
+    },
+    {
+        "region_code": "ZA-GT",
+        "metric_type": "corruption_index",
+        "value": 58.3,
+        "unit": "index",
+        "date": "2023-02-20",
+        "confidence": 0.87
+    },
+    {
+        "region_code": "ZA-GT",
+        "metric_type": "public_participation",
+        "value": 71.5,
+        "unit": "index",
+        "date": "2023-03-15",
+        "confidence": 0.91
+    },
+    {
+        "region_code": "KE-NB",
+        "metric_type": "audit_outcome",
+        "value": 76.2,
+        "status": "Qualified",
+        "unit": "score",
+        "date": "2023-01-28",
+        "confidence": 0.92
+    },
+    {
+        "region_code": "KE-NB",
+        "metric_type": "corruption_index",
+        "value": 62.8,
+        "unit": "index",
+        "date": "2023-02-22",
+        "confidence": 0.85
+    },
+    {
+        "region_code": "KE-NB",
+        "metric_type": "public_participation",
+        "value": 67.9,
+        "unit": "index",
+        "date": "2023-03-18",
+        "confidence": 0.89
+    }
+]
+
+_DEMO_INFRASTRUCTURE_METRICS = [
+    {
+        "region_code": "ZA-GT",
+        "metric_type": "roads_paved",
+        "value": 72.4,
+        "unit": "%",
+        "date": "2023-01-30",
+        "confidence": 0.92
+    },
+    {
+        "region_code": "ZA-GT",
+        "metric_type": "internet_connectivity",
+        "value": 81.2,
+        "unit": "%",
+        "date": "2023-02-25",
+        "confidence": 0.93
+    },
+    {
+        "region_code": "ZA-GT",
+        "metric_type": "public_transport_access",
+        "value": 67.8,
+        "unit": "%",
+        "date": "2023-03-20",
+        "confidence": 0.89
+    },
+    {
+        "region_code": "KE-NB",
+        "metric_type": "roads_paved",
+        "value": 65.1,
+        "unit": "%",
+        "date": "2023-01-28",
+        "confidence": 0.90
+    },
+    {
+        "region_code": "KE-NB",
+        "metric_type": "internet_connectivity",
+        "value": 75.8,
+        "unit": "%",
+        "date": "2023-02-23",
+        "confidence": 0.91
+    },
+    {
+        "region_code": "KE-NB",
+        "metric_type": "public_transport_access",
+        "value": 72.3,
+        "unit": "%",
+        "date": "2023-03-18",
+        "confidence": 0.88
+    }
+]
+
+_DEMO_ESG_SCORES = [
+    {
+        "region_code": "ZA-GT",
+        "environmental_score": 72.5,
+        "social_score": 68.9,
+        "governance_score": 64.2,
+        "infrastructure_score": 70.1,
+        "overall_score": 68.9,
+        "date": "2023-03-25",
+        "methodology": "WizData ESG Composite Methodology v1.0",
+        "confidence": 0.91
+    },
+    {
+        "region_code": "KE-NB",
+        "environmental_score": 69.2,
+        "social_score": 65.3,
+        "governance_score": 61.8,
+        "infrastructure_score": 67.5,
+        "overall_score": 66.0,
+        "date": "2023-03-25",
+        "methodology": "WizData ESG Composite Methodology v1.0",
+        "confidence": 0.89
+    }
+]
+
+
 class AfricaESGFetcher(BaseESGFetcher):
     """
     Class for fetching ESG data from various sources for African countries and regions
@@ -81,6 +405,46 @@ class AfricaESGFetcher(BaseESGFetcher):
             logger.error(f"Error getting regions: {str(e)}")
             return []
             
+    def _read_metrics_frame(self, model, region_code, start_date_obj, end_date_obj):
+        """
+        Run a column-level metrics query and load the result straight into pandas
+
+        Args:
+            model: Metric model class to query (e.g., EnvironmentalMetric)
+            region_code (str, optional): Region code to filter by
+            start_date_obj (date): Start of the date range
+            end_date_obj (date): End of the date range
+
+        Returns:
+            pandas.DataFrame: DataFrame with one row per metric
+        """
+        columns = [
+            model.id,
+            model.region_id,
+            Region.name.label("region_name"),
+            Region.code.label("region_code"),
+            model.metric_type,
+            model.value,
+        ]
+
+        # Governance metrics carry an extra status column
+        if hasattr(model, "status"):
+            columns.append(model.status)
+
+        columns.extend([model.unit, model.date, model.confidence])
+
+        query = db.session.query(*columns).join(Region, Region.id == model.region_id)
+
+        if region_code:
+            query = query.filter(Region.code == region_code)
+
+        query = query.filter(model.date >= start_date_obj)
+        query = query.filter(model.date <= end_date_obj)
+
+        # Let pandas fill the columns directly from the SQL result instead of
+        # looping over ORM rows in Python
+        return pd.read_sql_query(query.statement, db.engine, parse_dates=["date"])
+
     async def fetch_environmental_metrics(self, region_code=None, start_date=None, end_date=None):
         """
         Fetch environmental metrics for the specified region and date range
@@ -93,49 +457,16 @@ class AfricaESGFetcher(BaseESGFetcher):
         Returns:
             pandas.DataFrame: DataFrame containing the environmental metrics
         """
+        # Parse the date range up front so a malformed date raises immediately
+        # instead of being swallowed into an empty DataFrame
+        start_date_obj = _parse_date_or(365, start_date)
+        end_date_obj = _parse_date_or(None, end_date)
+        
         try:
-            # Set default dates if not provided
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
-            if not end_date:
-                end_date = datetime.now().strftime("%Y-%m-%d")
-                
-            # Build query
-            query = EnvironmentalMetric.query.join(Region)
-            
-            if region_code:
-                query = query.filter(Region.code == region_code)
-                
-            # Filter by date range
-            start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-            end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
-            
-            query = query.filter(EnvironmentalMetric.date >= start_date_obj)
-            query = query.filter(EnvironmentalMetric.date <= end_date_obj)
-            
-            # Execute query
-            metrics = query.all()
-            
-            # Format results
-            result = []
-            for metric in metrics:
-                result.append({
-                    "id": metric.id,
-                    "region_id": metric.region_id,
-                    "region_name": metric.region.name,
-                    "region_code": metric.region.code,
-                    "metric_type": metric.metric_type,
-                    "value": metric.value,
-                    "unit": metric.unit,
-                    "date": metric.date.isoformat(),
-                    "confidence": metric.confidence
-                })
-                
-            # Convert to DataFrame
-            if result:
-                return pd.DataFrame(result)
-            else:
-                return pd.DataFrame()
+            # Run the blocking query and DataFrame build in a worker thread
+            # so other coroutines keep making progress
+            return await asyncio.to_thread(
+                self._read_metrics_frame, EnvironmentalMetric, region_code, start_date_obj, end_date_obj)
                 
         except Exception as e:
             logger.error(f"Error fetching environmental metrics: {str(e)}")
@@ -153,49 +484,16 @@ class AfricaESGFetcher(BaseESGFetcher):
         Returns:
             pandas.DataFrame: DataFrame containing the social metrics
         """
+        # Parse the date range up front so a malformed date raises immediately
+        # instead of being swallowed into an empty DataFrame
+        start_date_obj = _parse_date_or(365, start_date)
+        end_date_obj = _parse_date_or(None, end_date)
+        
         try:
-            # Set default dates if not provided
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
-            if not end_date:
-                end_date = datetime.now().strftime("%Y-%m-%d")
-                
-            # Build query
-            query = SocialMetric.query.join(Region)
-            
-            if region_code:
-                query = query.filter(Region.code == region_code)
-                
-            # Filter by date range
-            start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-            end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
-            
-            query = query.filter(SocialMetric.date >= start_date_obj)
-            query = query.filter(SocialMetric.date <= end_date_obj)
-            
-            # Execute query
-            metrics = query.all()
-            
-            # Format results
-            result = []
-            for metric in metrics:
-                result.append({
-                    "id": metric.id,
-                    "region_id": metric.region_id,
-                    "region_name": metric.region.name,
-                    "region_code": metric.region.code,
-                    "metric_type": metric.metric_type,
-                    "value": metric.value,
-                    "unit": metric.unit,
-                    "date": metric.date.isoformat(),
-                    "confidence": metric.confidence
-                })
-                
-            # Convert to DataFrame
-            if result:
-                return pd.DataFrame(result)
-            else:
-                return pd.DataFrame()
+            # Run the blocking query and DataFrame build in a worker thread
+            # so other coroutines keep making progress
+            return await asyncio.to_thread(
+                self._read_metrics_frame, SocialMetric, region_code, start_date_obj, end_date_obj)
                 
         except Exception as e:
             logger.error(f"Error fetching social metrics: {str(e)}")
@@ -213,50 +511,16 @@ class AfricaESGFetcher(BaseESGFetcher):
         Returns:
             pandas.DataFrame: DataFrame containing the governance metrics
         """
+        # Parse the date range up front so a malformed date raises immediately
+        # instead of being swallowed into an empty DataFrame
+        start_date_obj = _parse_date_or(365, start_date)
+        end_date_obj = _parse_date_or(None, end_date)
+        
         try:
-            # Set default dates if not provided
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
-            if not end_date:
-                end_date = datetime.now().strftime("%Y-%m-%d")
-                
-            # Build query
-            query = GovernanceMetric.query.join(Region)
-            
-            if region_code:
-                query = query.filter(Region.code == region_code)
-                
-            # Filter by date range
-            start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-            end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
-            
-            query = query.filter(GovernanceMetric.date >= start_date_obj)
-            query = query.filter(GovernanceMetric.date <= end_date_obj)
-            
-            # Execute query
-            metrics = query.all()
-            
-            # Format results
-            result = []
-            for metric in metrics:
-                result.append({
-                    "id": metric.id,
-                    "region_id": metric.region_id,
-                    "region_name": metric.region.name,
-                    "region_code": metric.region.code,
-                    "metric_type": metric.metric_type,
-                    "value": metric.value,
-                    "status": metric.status,
-                    "unit": metric.unit,
-                    "date": metric.date.isoformat(),
-                    "confidence": metric.confidence
-                })
-                
-            # Convert to DataFrame
-            if result:
-                return pd.DataFrame(result)
-            else:
-                return pd.DataFrame()
+            # Run the blocking query and DataFrame build in a worker thread
+            # so other coroutines keep making progress
+            return await asyncio.to_thread(
+                self._read_metrics_frame, GovernanceMetric, region_code, start_date_obj, end_date_obj)
                 
         except Exception as e:
             logger.error(f"Error fetching governance metrics: {str(e)}")
@@ -274,49 +538,16 @@ class AfricaESGFetcher(BaseESGFetcher):
         Returns:
             pandas.DataFrame: DataFrame containing the infrastructure metrics
         """
+        # Parse the date range up front so a malformed date raises immediately
+        # instead of being swallowed into an empty DataFrame
+        start_date_obj = _parse_date_or(365, start_date)
+        end_date_obj = _parse_date_or(None, end_date)
+        
         try:
-            # Set default dates if not provided
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
-            if not end_date:
-                end_date = datetime.now().strftime("%Y-%m-%d")
-                
-            # Build query
-            query = InfrastructureMetric.query.join(Region)
-            
-            if region_code:
-                query = query.filter(Region.code == region_code)
-                
-            # Filter by date range
-            start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-            end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
-            
-            query = query.filter(InfrastructureMetric.date >= start_date_obj)
-            query = query.filter(InfrastructureMetric.date <= end_date_obj)
-            
-            # Execute query
-            metrics = query.all()
-            
-            # Format results
-            result = []
-            for metric in metrics:
-                result.append({
-                    "id": metric.id,
-                    "region_id": metric.region_id,
-                    "region_name": metric.region.name,
-                    "region_code": metric.region.code,
-                    "metric_type": metric.metric_type,
-                    "value": metric.value,
-                    "unit": metric.unit,
-                    "date": metric.date.isoformat(),
-                    "confidence": metric.confidence
-                })
-                
-            # Convert to DataFrame
-            if result:
-                return pd.DataFrame(result)
-            else:
-                return pd.DataFrame()
+            # Run the blocking query and DataFrame build in a worker thread
+            # so other coroutines keep making progress
+            return await asyncio.to_thread(
+                self._read_metrics_frame, InfrastructureMetric, region_code, start_date_obj, end_date_obj)
                 
         except Exception as e:
             logger.error(f"Error fetching infrastructure metrics: {str(e)}")
@@ -333,23 +564,25 @@ class AfricaESGFetcher(BaseESGFetcher):
         Returns:
             dict: Dictionary containing the ESG scores
         """
+        # Parse the requested date up front
+        date_obj = _parse_date_or(None, date)
+        
         try:
-            # Set default date if not provided
-            if not date:
-                date = datetime.now().strftime("%Y-%m-%d")
-                
             # Build query
             query = ESGCompositeScore.query.join(Region)
-            
+
             if region_code:
                 query = query.filter(Region.code == region_code)
-                
-            # Get the closest date if exact date not available
-            date_obj = datetime.strptime(date, "%Y-%m-%d").date()
-            
-            # Execute query - get the score closest to the requested date
-            score = query.order_by(db.func.abs(db.func.julianday(ESGCompositeScore.date) - 
-                                         db.func.julianday(date_obj))).first()
+
+            if date:
+                # Execute query - get the score closest to the requested date
+                score = query.order_by(db.func.abs(db.func.julianday(ESGCompositeScore.date) -
+                                             db.func.julianday(date_obj))).first()
+            else:
+                # Most common path: no explicit date means "latest score",
+                # which only needs an index-friendly ORDER BY date DESC
+                # instead of the julianday-distance sort
+                score = query.order_by(ESGCompositeScore.date.desc()).first()
             
             # Format result
             if score:
@@ -363,7 +596,7 @@ class AfricaESGFetcher(BaseESGFetcher):
                     "governance_score": score.governance_score,
                     "infrastructure_score": score.infrastructure_score,
                     "overall_score": score.overall_score,
-                    "date": score.date.isoformat(),
+                    "date": score.date.isoformat() if score.date else None,
                     "methodology": score.methodology,
                     "confidence": score.confidence
                 }
@@ -388,31 +621,45 @@ class AfricaESGFetcher(BaseESGFetcher):
         Returns:
             pandas.DataFrame: DataFrame containing the comparative analysis
         """
-        try:
-            # Set defaults if not provided
-            if not date:
-                date = datetime.now().strftime("%Y-%m-%d")
-            if not dimension:
-                dimension = "overall"  # Compare overall scores by default
-                
-            date_obj = datetime.strptime(date, "%Y-%m-%d").date()
+        # Parse the requested date up front
+        date_obj = _parse_date_or(None, date)
+        
+        if not dimension:
+            dimension = "overall"  # Compare overall scores by default
             
+        try:
             if dimension == "overall":
                 # Compare overall ESG scores
                 result = []
-                
+
+                # Load all candidate regions and scores in one pass, then pick
+                # the nearest date per region with a vectorized argmin over a
+                # flat array of date ordinals instead of one julianday-sorted
+                # query per region
+                regions = Region.query.filter(Region.code.in_(region_codes)).all()
+                region_by_code = {region.code: region for region in regions}
+
+                scores = []
+                if regions:
+                    scores = ESGCompositeScore.query.filter(
+                        ESGCompositeScore.region_id.in_([r.id for r in regions])).all()
+
+                score_region_ids = np.asarray([s.region_id for s in scores], dtype=np.int32)
+                date_ords = np.asarray([s.date.toordinal() for s in scores], dtype=np.int32)
+                date_dist = np.abs(date_ords - date_obj.toordinal())
+
                 for region_code in region_codes:
-                    # Get region
-                    region = Region.query.filter_by(code=region_code).first()
-                    
+                    region = region_by_code.get(region_code)
+
                     if not region:
                         continue
-                        
+
                     # Get the score closest to the requested date
-                    score = ESGCompositeScore.query.filter_by(region_id=region.id)\
-                        .order_by(db.func.abs(db.func.julianday(ESGCompositeScore.date) - 
-                                       db.func.julianday(date_obj))).first()
-                    
+                    candidates = np.flatnonzero(score_region_ids == region.id)
+                    score = None
+                    if candidates.size:
+                        score = scores[candidates[date_dist[candidates].argmin()]]
+
                     if score:
                         result.append({
                             "region_id": region.id,
@@ -423,12 +670,15 @@ class AfricaESGFetcher(BaseESGFetcher):
                             "governance_score": score.governance_score,
                             "infrastructure_score": score.infrastructure_score,
                             "overall_score": score.overall_score,
-                            "date": score.date.isoformat()
+                            "date": score.date
                         })
                 
-                # Convert to DataFrame
+                # Convert to DataFrame, keeping dates as packed datetime64
+                # instead of per-row isoformat strings
                 if result:
-                    return pd.DataFrame(result)
+                    df = pd.DataFrame(result)
+                    df['date'] = pd.to_datetime(df['date'])
+                    return df
                 else:
                     return pd.DataFrame()
             else:
@@ -473,7 +723,7 @@ class AfricaESGFetcher(BaseESGFetcher):
                                     "metric": metric_type,
                                     "value": metric.value,
                                     "unit": metric.unit,
-                                    "date": metric.date.isoformat()
+                                    "date": metric.date
                                 })
                         
                         result.extend(metric_data)
@@ -492,12 +742,15 @@ class AfricaESGFetcher(BaseESGFetcher):
                                 "metric": metric.metric_type,
                                 "value": metric.value,
                                 "unit": metric.unit,
-                                "date": metric.date.isoformat()
+                                "date": metric.date
                             })
                 
-                # Convert to DataFrame
+                # Convert to DataFrame, keeping dates as packed datetime64
+                # instead of per-row isoformat strings
                 if result:
-                    return pd.DataFrame(result)
+                    df = pd.DataFrame(result)
+                    df['date'] = pd.to_datetime(df['date'])
+                    return df
                 else:
                     return pd.DataFrame()
                 
@@ -566,35 +819,25 @@ class AfricaESGFetcher(BaseESGFetcher):
             elif dimension == "infrastructure":
                 df = await self.fetch_infrastructure_metrics(region_code, start_date, end_date)
             else:
-                # Fetch all dimensions
-                env_df = await self.fetch_environmental_metrics(region_code, start_date, end_date)
-                soc_df = await self.fetch_social_metrics(region_code, start_date, end_date)
-                gov_df = await self.fetch_governance_metrics(region_code, start_date, end_date)
-                inf_df = await self.fetch_infrastructure_metrics(region_code, start_date, end_date)
-                
-                # Add dimension column to each DataFrame
-                env_df['dimension'] = 'environmental'
-                soc_df['dimension'] = 'social'
-                gov_df['dimension'] = 'governance'
-                inf_df['dimension'] = 'infrastructure'
-                
-                # Combine data
-                if not env_df.empty or not soc_df.empty or not gov_df.empty or not inf_df.empty:
-                    # Combine only non-empty DataFrames
-                    dfs = []
-                    if not env_df.empty:
-                        dfs.append(env_df)
-                    if not soc_df.empty:
-                        dfs.append(soc_df)
-                    if not gov_df.empty:
-                        dfs.append(gov_df)
-                    if not inf_df.empty:
-                        dfs.append(inf_df)
-                        
-                    if dfs:
-                        df = pd.concat(dfs, ignore_index=True)
-                    else:
-                        df = pd.DataFrame()
+                # Fetch all dimensions and build the combined frame once at
+                # the end - tagging only non-empty frames avoids pointless
+                # column assignments on empty DataFrames
+                dimension_fetchers = (
+                    ("environmental", self.fetch_environmental_metrics),
+                    ("social", self.fetch_social_metrics),
+                    ("governance", self.fetch_governance_metrics),
+                    ("infrastructure", self.fetch_infrastructure_metrics),
+                )
+
+                dfs = []
+                for dim_name, fetch in dimension_fetchers:
+                    dim_df = await fetch(region_code, start_date, end_date)
+                    if not dim_df.empty:
+                        dim_df['dimension'] = dim_name
+                        dfs.append(dim_df)
+
+                if dfs:
+                    df = pd.concat(dfs, ignore_index=True, copy=False)
                 else:
                     df = pd.DataFrame()
                     
@@ -605,6 +848,10 @@ class AfricaESGFetcher(BaseESGFetcher):
                     "message": "No data found for the specified parameters"
                 }
                 
+            # Serialize dates to ISO strings only at the export boundary
+            if 'date' in df.columns and pd.api.types.is_datetime64_any_dtype(df['date']):
+                df['date'] = df['date'].dt.strftime('%Y-%m-%d')
+
             # Setup output path
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             dim_part = f"_{dimension}" if dimension else "_all"
@@ -646,395 +893,135 @@ class AfricaESGFetcher(BaseESGFetcher):
             dict: Dictionary containing the seed results
         """
         try:
-            # 1. Add some African regions
-            regions = [
-                {
-                    "name": "South Africa",
-                    "code": "ZA",
-                    "region_type": "country",
-                    "parent_id": None,
-                    "country": "South Africa",
-                    "population": 59308690,
-                    "area_km2": 1221037
-                },
-                {
-                    "name": "Gauteng",
-                    "code": "ZA-GT",
-                    "region_type": "province",
-                    "parent_id": 1,
-                    "country": "South Africa",
-                    "population": 15488137,
-                    "area_km2": 18178
-                },
-                {
-                    "name": "City of Johannesburg",
-                    "code": "ZA-GT-JHB",
-                    "region_type": "municipality",
-                    "parent_id": 2,
-                    "country": "South Africa",
-                    "population": 5738535,
-                    "area_km2": 1645
-                },
-                {
-                    "name": "Kenya",
-                    "code": "KE",
-                    "region_type": "country",
-                    "parent_id": None,
-                    "country": "Kenya",
-                    "population": 53771296,
-                    "area_km2": 580367
-                },
-                {
-                    "name": "Nairobi",
-                    "code": "KE-NB",
-                    "region_type": "province",
-                    "parent_id": 4,
-                    "country": "Kenya",
-                    "population": 4397073,
-                    "area_km2": 696
-                }
-            ]
+            # Disable autoflush so the region lookups below cannot
+            # trigger mini-flushes mid-loop; IDs are assigned by one
+            # explicit flush instead
+            with db.session.no_autoflush:
+                # 1. Add some African regions
             
-            for region_data in regions:
-                # Check if region already exists
-                existing = Region.query.filter_by(code=region_data["code"]).first()
+                for region_data in _DEMO_REGIONS:
+                    # Check if region already exists
+                    existing = Region.query.filter_by(code=region_data["code"]).first()
                 
-                if not existing:
-                    region = Region(**region_data)
-                    db.session.add(region)
+                    if not existing:
+                        region = Region(**region_data)
+                        db.session.add(region)
             
-            # 2. Add environmental metrics
-            environmental_metrics = [
-                {
-                    "region_code": "ZA-GT",
-                    "metric_type": "electricity_access",
-                    "value": 87.5,
-                    "unit": "%",
-                    "date": "2023-01-15",
-                    "confidence": 0.95
-                },
-                {
-                    "region_code": "ZA-GT",
-                    "metric_type": "water_access",
-                    "value": 92.1,
-                    "unit": "%",
-                    "date": "2023-02-10",
-                    "confidence": 0.92
-                },
-                {
-                    "region_code": "ZA-GT",
-                    "metric_type": "air_quality_index",
-                    "value": 65.4,
-                    "unit": "AQI",
-                    "date": "2023-03-05",
-                    "confidence": 0.88
-                },
-                {
-                    "region_code": "KE-NB",
-                    "metric_type": "electricity_access",
-                    "value": 75.8,
-                    "unit": "%",
-                    "date": "2023-01-10",
-                    "confidence": 0.93
-                },
-                {
-                    "region_code": "KE-NB",
-                    "metric_type": "water_access",
-                    "value": 83.2,
-                    "unit": "%",
-                    "date": "2023-02-05",
-                    "confidence": 0.91
-                },
-                {
-                    "region_code": "KE-NB",
-                    "metric_type": "air_quality_index",
-                    "value": 72.3,
-                    "unit": "AQI",
-                    "date": "2023-03-01",
-                    "confidence": 0.87
+                # Assign IDs to any newly added regions in one explicit flush
+                db.session.flush()
+
+                # Resolve all regions once - the metric loops below only need a
+                # code -> region lookup, not one query per row
+                region_map = {
+                    region.code: region
+                    for region in Region.query.filter(
+                        Region.code.in_([r["code"] for r in _DEMO_REGIONS])).all()
                 }
-            ]
             
-            for metric_data in environmental_metrics:
-                region = Region.query.filter_by(code=metric_data["region_code"]).first()
+                # 2. Add environmental metrics
+            
+                env_mappings = []
+                for metric_data in _DEMO_ENVIRONMENTAL_METRICS:
+                    region = region_map.get(metric_data["region_code"])
                 
-                if region:
-                    # Extract and format data
-                    date_str = metric_data.pop("date")
-                    region_code = metric_data.pop("region_code")
-                    
-                    # Create metric
-                    metric = EnvironmentalMetric(
-                        region_id=region.id,
-                        date=datetime.strptime(date_str, "%Y-%m-%d").date(),
-                        **metric_data
-                    )
-                    
-                    db.session.add(metric)
+                    if region:
+                        env_mappings.append({
+                            "region_id": region.id,
+                            "date": _parse_date(metric_data["date"]),
+                            **{k: v for k, v in metric_data.items()
+                               if k not in ("date", "region_code")}
+                        })
             
-            # 3. Add social metrics
-            social_metrics = [
-                {
-                    "region_code": "ZA-GT",
-                    "metric_type": "literacy_rate",
-                    "value": 91.2,
-                    "unit": "%",
-                    "date": "2023-01-20",
-                    "confidence": 0.93
-                },
-                {
-                    "region_code": "ZA-GT",
-                    "metric_type": "healthcare_access",
-                    "value": 78.5,
-                    "unit": "%",
-                    "date": "2023-02-15",
-                    "confidence": 0.90
-                },
-                {
-                    "region_code": "ZA-GT",
-                    "metric_type": "employment_rate",
-                    "value": 65.8,
-                    "unit": "%",
-                    "date": "2023-03-10",
-                    "confidence": 0.89
-                },
-                {
-                    "region_code": "KE-NB",
-                    "metric_type": "literacy_rate",
-                    "value": 87.5,
-                    "unit": "%",
-                    "date": "2023-01-22",
-                    "confidence": 0.92
-                },
-                {
-                    "region_code": "KE-NB",
-                    "metric_type": "healthcare_access",
-                    "value": 72.3,
-                    "unit": "%",
-                    "date": "2023-02-18",
-                    "confidence": 0.89
-                },
-                {
-                    "region_code": "KE-NB",
-                    "metric_type": "employment_rate",
-                    "value": 61.2,
-                    "unit": "%",
-                    "date": "2023-03-12",
-                    "confidence": 0.87
-                }
-            ]
+                # Insert the whole dimension in one batched statement instead of
+                # one ORM unit-of-work INSERT per row; large real ingests take the
+                # COPY path on PostgreSQL
+                self._bulk_insert_metrics(db.session, EnvironmentalMetric, env_mappings)
             
-            for metric_data in social_metrics:
-                region = Region.query.filter_by(code=metric_data["region_code"]).first()
+                # 3. Add social metrics
+            
+                social_mappings = []
+                for metric_data in _DEMO_SOCIAL_METRICS:
+                    region = region_map.get(metric_data["region_code"])
                 
-                if region:
-                    # Extract and format data
-                    date_str = metric_data.pop("date")
-                    region_code = metric_data.pop("region_code")
-                    
-                    # Create metric
-                    metric = SocialMetric(
-                        region_id=region.id,
-                        date=datetime.strptime(date_str, "%Y-%m-%d").date(),
-                        **metric_data
-                    )
-                    
-                    db.session.add(metric)
+                    if region:
+                        social_mappings.append({
+                            "region_id": region.id,
+                            "date": _parse_date(metric_data["date"]),
+                            **{k: v for k, v in metric_data.items()
+                               if k not in ("date", "region_code")}
+                        })
             
-            # 4. Add governance metrics
-            governance_metrics = [
-                {
-                    "region_code": "ZA-GT",
-                    "metric_type": "audit_outcome",
-                    "value": 82.0,
-                    "status": "Unqualified",
-                    "unit": "score",
-                    "date": "2023-01-25",
-                    "confidence": 0.94
-                },
-                {
-                    "region_code": "ZA-GT",
-                    "metric_type": "corruption_index",
-                    "value": 58.3,
-                    "unit": "index",
-                    "date": "2023-02-20",
-                    "confidence": 0.87
-                },
-                {
-                    "region_code": "ZA-GT",
-                    "metric_type": "public_participation",
-                    "value": 71.5,
-                    "unit": "index",
-                    "date": "2023-03-15",
-                    "confidence": 0.91
-                },
-                {
-                    "region_code": "KE-NB",
-                    "metric_type": "audit_outcome",
-                    "value": 76.2,
-                    "status": "Qualified",
-                    "unit": "score",
-                    "date": "2023-01-28",
-                    "confidence": 0.92
-                },
-                {
-                    "region_code": "KE-NB",
-                    "metric_type": "corruption_index",
-                    "value": 62.8,
-                    "unit": "index",
-                    "date": "2023-02-22",
-                    "confidence": 0.85
-                },
-                {
-                    "region_code": "KE-NB",
-                    "metric_type": "public_participation",
-                    "value": 67.9,
-                    "unit": "index",
-                    "date": "2023-03-18",
-                    "confidence": 0.89
-                }
-            ]
+                # Insert the whole dimension in one batched statement instead of
+                # one ORM unit-of-work INSERT per row; large real ingests take the
+                # COPY path on PostgreSQL
+                self._bulk_insert_metrics(db.session, SocialMetric, social_mappings)
             
-            for metric_data in governance_metrics:
-                region = Region.query.filter_by(code=metric_data["region_code"]).first()
+                # 4. Add governance metrics
+            
+                governance_mappings = []
+                for metric_data in _DEMO_GOVERNANCE_METRICS:
+                    region = region_map.get(metric_data["region_code"])
                 
-                if region:
-                    # Extract and format data
-                    date_str = metric_data.pop("date")
-                    region_code = metric_data.pop("region_code")
-                    
-                    # Create metric
-                    metric = GovernanceMetric(
-                        region_id=region.id,
-                        date=datetime.strptime(date_str, "%Y-%m-%d").date(),
-                        **metric_data
-                    )
-                    
-                    db.session.add(metric)
+                    if region:
+                        governance_mappings.append({
+                            "region_id": region.id,
+                            "date": _parse_date(metric_data["date"]),
+                            **{k: v for k, v in metric_data.items()
+                               if k not in ("date", "region_code")}
+                        })
             
-            # 5. Add infrastructure metrics
-            infrastructure_metrics = [
-                {
-                    "region_code": "ZA-GT",
-                    "metric_type": "roads_paved",
-                    "value": 72.4,
-                    "unit": "%",
-                    "date": "2023-01-30",
-                    "confidence": 0.92
-                },
-                {
-                    "region_code": "ZA-GT",
-                    "metric_type": "internet_connectivity",
-                    "value": 81.2,
-                    "unit": "%",
-                    "date": "2023-02-25",
-                    "confidence": 0.93
-                },
-                {
-                    "region_code": "ZA-GT",
-                    "metric_type": "public_transport_access",
-                    "value": 67.8,
-                    "unit": "%",
-                    "date": "2023-03-20",
-                    "confidence": 0.89
-                },
-                {
-                    "region_code": "KE-NB",
-                    "metric_type": "roads_paved",
-                    "value": 65.1,
-                    "unit": "%",
-                    "date": "2023-01-28",
-                    "confidence": 0.90
-                },
-                {
-                    "region_code": "KE-NB",
-                    "metric_type": "internet_connectivity",
-                    "value": 75.8,
-                    "unit": "%",
-                    "date": "2023-02-23",
-                    "confidence": 0.91
-                },
-                {
-                    "region_code": "KE-NB",
-                    "metric_type": "public_transport_access",
-                    "value": 72.3,
-                    "unit": "%",
-                    "date": "2023-03-18",
-                    "confidence": 0.88
-                }
-            ]
+                # Insert the whole dimension in one batched statement instead of
+                # one ORM unit-of-work INSERT per row; large real ingests take the
+                # COPY path on PostgreSQL
+                self._bulk_insert_metrics(db.session, GovernanceMetric, governance_mappings)
             
-            for metric_data in infrastructure_metrics:
-                region = Region.query.filter_by(code=metric_data["region_code"]).first()
+                # 5. Add infrastructure metrics
+            
+                infrastructure_mappings = []
+                for metric_data in _DEMO_INFRASTRUCTURE_METRICS:
+                    region = region_map.get(metric_data["region_code"])
                 
-                if region:
-                    # Extract and format data
-                    date_str = metric_data.pop("date")
-                    region_code = metric_data.pop("region_code")
-                    
-                    # Create metric
-                    metric = InfrastructureMetric(
-                        region_id=region.id,
-                        date=datetime.strptime(date_str, "%Y-%m-%d").date(),
-                        **metric_data
-                    )
-                    
-                    db.session.add(metric)
+                    if region:
+                        infrastructure_mappings.append({
+                            "region_id": region.id,
+                            "date": _parse_date(metric_data["date"]),
+                            **{k: v for k, v in metric_data.items()
+                               if k not in ("date", "region_code")}
+                        })
             
-            # 6. Add ESG scores
-            esg_scores = [
-                {
-                    "region_code": "ZA-GT",
-                    "environmental_score": 72.5,
-                    "social_score": 68.9,
-                    "governance_score": 64.2,
-                    "infrastructure_score": 70.1,
-                    "overall_score": 68.9,
-                    "date": "2023-03-25",
-                    "methodology": "WizData ESG Composite Methodology v1.0",
-                    "confidence": 0.91
-                },
-                {
-                    "region_code": "KE-NB",
-                    "environmental_score": 69.2,
-                    "social_score": 65.3,
-                    "governance_score": 61.8,
-                    "infrastructure_score": 67.5,
-                    "overall_score": 66.0,
-                    "date": "2023-03-25",
-                    "methodology": "WizData ESG Composite Methodology v1.0",
-                    "confidence": 0.89
-                }
-            ]
+                # Insert the whole dimension in one batched statement instead of
+                # one ORM unit-of-work INSERT per row; large real ingests take the
+                # COPY path on PostgreSQL
+                self._bulk_insert_metrics(db.session, InfrastructureMetric, infrastructure_mappings)
             
-            for score_data in esg_scores:
-                region = Region.query.filter_by(code=score_data["region_code"]).first()
-                
-                if region:
-                    # Extract and format data
-                    date_str = score_data.pop("date")
-                    region_code = score_data.pop("region_code")
-                    
-                    # Create score
-                    score = ESGCompositeScore(
-                        region_id=region.id,
-                        date=datetime.strptime(date_str, "%Y-%m-%d").date(),
-                        **score_data
-                    )
-                    
-                    db.session.add(score)
+                # 6. Add ESG scores
+            
+                score_mappings = []
+                for score_data in _DEMO_ESG_SCORES:
+                    region = region_map.get(score_data["region_code"])
+
+                    if region:
+                        score_mappings.append({
+                            "region_id": region.id,
+                            "date": _parse_date(score_data["date"]),
+                            **{k: v for k, v in score_data.items()
+                               if k not in ("date", "region_code")}
+                        })
+
+                # Insert the scores in one batched statement as well
+                self._bulk_insert_metrics(db.session, ESGCompositeScore, score_mappings)
             
             # Commit changes
             db.session.commit()
             
             return {
                 "status": "success",
-                "regions_added": len(regions),
-                "environmental_metrics_added": len(environmental_metrics),
-                "social_metrics_added": len(social_metrics),
-                "governance_metrics_added": len(governance_metrics),
-                "infrastructure_metrics_added": len(infrastructure_metrics),
-                "esg_scores_added": len(esg_scores)
+                "regions_added": len(_DEMO_REGIONS),
+                "environmental_metrics_added": len(_DEMO_ENVIRONMENTAL_METRICS),
+                "social_metrics_added": len(_DEMO_SOCIAL_METRICS),
+                "governance_metrics_added": len(_DEMO_GOVERNANCE_METRICS),
+                "infrastructure_metrics_added": len(_DEMO_INFRASTRUCTURE_METRICS),
+                "esg_scores_added": len(_DEMO_ESG_SCORES)
             }
             
         except Exception as e:
@@ -7,20 +7,164 @@ It implements web scraping and data processing for Stats SA's published statisti
 
 import logging
 import asyncio
+import hashlib
 import json
 import os
 from datetime import datetime, date
+from types import MappingProxyType
 import re
 import aiohttp
 import pandas as pd
 import numpy as np
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import trafilatura
 
 from src.ingestion.esg.base_esg_fetcher import BaseESGFetcher
 
 logger = logging.getLogger(__name__)
 
+# ISO 3166-2 style region codes for the South African provinces
+_CODE_TO_PROVINCE = {
+    "ZA-EC": "Eastern Cape",
+    "ZA-FS": "Free State",
+    "ZA-GT": "Gauteng",
+    "ZA-NL": "KwaZulu-Natal",
+    "ZA-LP": "Limpopo",
+    "ZA-MP": "Mpumalanga",
+    "ZA-NW": "North West",
+    "ZA-NC": "Northern Cape",
+    "ZA-WC": "Western Cape"
+}
+
+# South African provinces covered by the mock tables below
+_PROVINCES = tuple(_CODE_TO_PROVINCE.values())
+
+# Mock metric values: metric_type -> (per-province overrides, national
+# default). The real implementation will replace these with figures
+# scraped from the GHS/CS publications.
+_ENVIRONMENTAL_VALUES = {
+    "electricity_access": ({"Gauteng": 91.2, "Western Cape": 94.5, "Eastern Cape": 85.4}, 89.3),
+    "water_access": ({"Gauteng": 95.1, "Western Cape": 98.9, "Eastern Cape": 75.3}, 85.4),
+    "waste_collection": ({"Gauteng": 87.5, "Western Cape": 91.8, "Eastern Cape": 42.1}, 66.9),
+}
+
+_SOCIAL_VALUES = {
+    "education_enrolment": ({"Gauteng": 97.8, "Western Cape": 96.9, "Eastern Cape": 94.2}, 95.3),
+    "literacy_rate": ({"Gauteng": 94.8, "Western Cape": 97.1, "Eastern Cape": 89.5}, 92.3),
+    "healthcare_access": ({"Gauteng": 82.5, "Western Cape": 86.2, "Eastern Cape": 64.9}, 73.8),
+    "grant_recipients": ({"Gauteng": 31.2, "Western Cape": 25.8, "Eastern Cape": 41.9}, 33.7),
+}
+
+_GOVERNANCE_VALUES = {
+    "service_satisfaction": ({"Gauteng": 62.5, "Western Cape": 68.7, "Eastern Cape": 48.9}, 56.3),
+    "municipal_performance": ({"Gauteng": 58.2, "Western Cape": 65.4, "Eastern Cape": 42.7}, 52.8),
+}
+
+_INFRASTRUCTURE_VALUES = {
+    "roads_paved": ({"Gauteng": 78.4, "Western Cape": 82.9, "Eastern Cape": 41.5}, 58.7),
+    "telecommunications": ({"Gauteng": 95.6, "Western Cape": 96.8, "Eastern Cape": 86.3}, 90.2),
+    "schools_access": ({"Gauteng": 87.5, "Western Cape": 89.2, "Eastern Cape": 65.4}, 74.8),
+    "clinics_access": ({"Gauteng": 82.5, "Western Cape": 86.2, "Eastern Cape": 64.9}, 73.8),
+}
+
+# Mapping of Stats SA indicators to ESG metrics. Read-only views so the
+# import-time tables built from them can't drift if a caller mutates one.
+_ENVIRONMENTAL_METRICS = MappingProxyType({
+    "electricity_access": "Households with access to electricity for lighting",
+    "water_access": "Households with access to piped/tap water",
+    "waste_collection": "Households with regular waste collection"
+})
+
+_SOCIAL_METRICS = MappingProxyType({
+    "education_enrolment": "School attendance of persons aged 7–18 years",
+    "literacy_rate": "Literacy rate for persons aged 15 years and older",
+    "healthcare_access": "Households with access to healthcare facilities within 5km",
+    "grant_recipients": "Persons receiving social grants"
+})
+
+_GOVERNANCE_METRICS = MappingProxyType({
+    "service_satisfaction": "Household satisfaction with government services",
+    "municipal_performance": "Satisfaction with performance of local municipality"
+})
+
+_INFRASTRUCTURE_METRICS = MappingProxyType({
+    "roads_paved": "Households with access to paved/tarred roads",
+    "telecommunications": "Households with access to telecommunications",
+    "schools_access": "Households with access to schools within 5km",
+    "clinics_access": "Households with access to healthcare facilities within 5km"
+})
+
+
+# Publication scraping only reads anchors, so parse just those instead of
+# building a tree for the whole page
+_LINK_STRAINER = SoupStrainer("a", href=True)
+
+
+def _parse_publication_links(html):
+    """
+    Extract anchor links from a Stats SA HTML page
+
+    Parsing with lxml (already installed as a trafilatura dependency)
+    restricted to the anchor strainer skips tree construction for every
+    node except the links actually read.
+
+    Args:
+        html (str): Raw HTML of a Stats SA publications page
+
+    Returns:
+        list: (text, href) tuples, one per anchor with an href
+    """
+    soup = BeautifulSoup(html, "lxml", parse_only=_LINK_STRAINER)
+    return [(a.get_text(strip=True), a["href"]) for a in soup.find_all("a")]
+
+
+def _read_file(path, mode="rb"):
+    """Read a whole file; runs in a worker thread via asyncio.to_thread"""
+    with open(path, mode) as f:
+        return f.read()
+
+
+def _write_file(path, data, mode="wb"):
+    """Write a whole file; runs in a worker thread via asyncio.to_thread"""
+    with open(path, mode) as f:
+        f.write(data)
+
+
+def _build_metric_tables(metric_values, descriptions, source, confidence):
+    """
+    Prebuild one mock metrics DataFrame per province from a value table
+
+    Building the frames once at import time leaves the fetch_* coroutines
+    with a lookup, a filter and a copy instead of per-call branching and
+    DataFrame construction.
+
+    Args:
+        metric_values (dict): metric_type -> (per-province overrides, default)
+        descriptions (dict): metric_type -> human-readable description
+        source (str): Publication the figures are attributed to
+        confidence (float): Confidence assigned to every record
+
+    Returns:
+        dict: Province name -> typed DataFrame in the standard metric record
+              layout, minus region_code which is attached per call
+    """
+    metric_types = list(metric_values)
+    tables = {}
+    for province in _PROVINCES + ("Unknown",):
+        values = [by_province.get(province, default)
+                  for by_province, default in metric_values.values()]
+        tables[province] = pd.DataFrame({
+            "metric_type": pd.Categorical(metric_types),
+            "value": np.asarray(values, dtype=np.float32),
+            "unit": pd.Categorical(["%"] * len(metric_types)),
+            "date": pd.Timestamp("2019-07-01"),  # Mid-year for annual data
+            "source": source,
+            "confidence": np.float32(confidence),
+            "description": [descriptions[m] for m in metric_types],
+        })
+    return tables
+
+
 class StatsSAFetcher(BaseESGFetcher):
     """
     Fetcher for Statistics South Africa (Stats SA) data
@@ -35,31 +179,12 @@ class StatsSAFetcher(BaseESGFetcher):
     STATS_SA_GHS_URL = "publications/P0318/P03182019.pdf"  # General Household Survey
     STATS_SA_CS_URL = "publications/Report-03-01-06/Report-03-01-062016.pdf"  # Community Survey
     
-    # Mapping of Stats SA indicators to ESG metrics
-    ENVIRONMENTAL_METRICS = {
-        "electricity_access": "Households with access to electricity for lighting",
-        "water_access": "Households with access to piped/tap water",
-        "waste_collection": "Households with regular waste collection"
-    }
-    
-    SOCIAL_METRICS = {
-        "education_enrolment": "School attendance of persons aged 7–18 years",
-        "literacy_rate": "Literacy rate for persons aged 15 years and older",
-        "healthcare_access": "Households with access to healthcare facilities within 5km",
-        "grant_recipients": "Persons receiving social grants"
-    }
-    
-    GOVERNANCE_METRICS = {
-        "service_satisfaction": "Household satisfaction with government services",
-        "municipal_performance": "Satisfaction with performance of local municipality"
-    }
-    
-    INFRASTRUCTURE_METRICS = {
-        "roads_paved": "Households with access to paved/tarred roads",
-        "telecommunications": "Households with access to telecommunications",
-        "schools_access": "Households with access to schools within 5km",
-        "clinics_access": "Households with access to healthcare facilities within 5km"
-    }
+    # Mapping of Stats SA indicators to ESG metrics (module-level constants
+    # re-exported here as the public API)
+    ENVIRONMENTAL_METRICS = _ENVIRONMENTAL_METRICS
+    SOCIAL_METRICS = _SOCIAL_METRICS
+    GOVERNANCE_METRICS = _GOVERNANCE_METRICS
+    INFRASTRUCTURE_METRICS = _INFRASTRUCTURE_METRICS
     
     def __init__(self):
         """Initialize the Stats SA fetcher"""
@@ -67,21 +192,6 @@ class StatsSAFetcher(BaseESGFetcher):
         self.cache_dir = os.path.join(self.base_cache_dir, "stats_sa")
         os.makedirs(self.cache_dir, exist_ok=True)
         
-        # Session for web requests
-        self.session = None
-    
-    async def _get_session(self):
-        """Get aiohttp session"""
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
-        return self.session
-    
-    async def _close_session(self):
-        """Close aiohttp session"""
-        if self.session is not None:
-            await self.session.close()
-            self.session = None
-    
     async def get_regions(self, country=None, region_type=None):
         """
         Get available regions from Stats SA
@@ -128,77 +238,11 @@ class StatsSAFetcher(BaseESGFetcher):
         Returns:
             pandas.DataFrame: DataFrame with environmental data
         """
-        logger.info(f"Fetching environmental data for region {region_code}")
-        
+        logger.info("Fetching environmental data for region %s", region_code)
+
         # In a real implementation, this would fetch and process data from Stats SA
-        # For this example, we'll generate data for demonstration purposes
-        data = []
-        
-        # Filter metric types
-        metrics = self.ENVIRONMENTAL_METRICS
-        if metric_types:
-            metrics = {k: v for k, v in metrics.items() if k in metric_types}
-        
-        # Extract province code
-        province = self._get_province_from_code(region_code)
-        
-        # Handle date range
-        if not start_date:
-            start_date = "2019-01-01"
-        if not end_date:
-            end_date = "2019-12-31"
-        
-        # Add sample data for each metric
-        for metric_type, description in metrics.items():
-            # This would be replaced with actual data from Stats SA
-            if metric_type == "electricity_access":
-                # Electricity access data
-                if province == "Gauteng":
-                    value = 91.2  # Percentage of households with electricity
-                elif province == "Western Cape":
-                    value = 94.5
-                elif province == "Eastern Cape":
-                    value = 85.4
-                else:
-                    value = 89.3  # Default
-            
-            elif metric_type == "water_access":
-                # Water access data
-                if province == "Gauteng":
-                    value = 95.1  # Percentage of households with piped water
-                elif province == "Western Cape":
-                    value = 98.9
-                elif province == "Eastern Cape":
-                    value = 75.3
-                else:
-                    value = 85.4  # Default
-            
-            elif metric_type == "waste_collection":
-                # Waste collection data
-                if province == "Gauteng":
-                    value = 87.5  # Percentage of households with waste collection
-                elif province == "Western Cape":
-                    value = 91.8
-                elif province == "Eastern Cape":
-                    value = 42.1
-                else:
-                    value = 66.9  # Default
-            
-            else:
-                continue  # Skip unknown metrics
-            
-            data.append({
-                "region_code": region_code,
-                "metric_type": metric_type,
-                "value": value,
-                "unit": "%",
-                "date": "2019-07-01",  # Mid-year for annual data
-                "source": "Stats SA General Household Survey 2019",
-                "confidence": 0.95,
-                "description": description
-            })
-        
-        return pd.DataFrame(data)
+        # For this example, we'll serve prebuilt demonstration tables
+        return self._mock_metrics(_ENV_TABLES, region_code, metric_types)
     
     async def fetch_social_data(self, region_code, metric_types=None, start_date=None, end_date=None):
         """
@@ -213,88 +257,11 @@ class StatsSAFetcher(BaseESGFetcher):
         Returns:
             pandas.DataFrame: DataFrame with social data
         """
-        logger.info(f"Fetching social data for region {region_code}")
-        
+        logger.info("Fetching social data for region %s", region_code)
+
         # In a real implementation, this would fetch and process data from Stats SA
-        # For this example, we'll generate data for demonstration purposes
-        data = []
-        
-        # Filter metric types
-        metrics = self.SOCIAL_METRICS
-        if metric_types:
-            metrics = {k: v for k, v in metrics.items() if k in metric_types}
-        
-        # Extract province code
-        province = self._get_province_from_code(region_code)
-        
-        # Handle date range
-        if not start_date:
-            start_date = "2019-01-01"
-        if not end_date:
-            end_date = "2019-12-31"
-        
-        # Add sample data for each metric
-        for metric_type, description in metrics.items():
-            # This would be replaced with actual data from Stats SA
-            if metric_type == "education_enrolment":
-                # Education enrolment data
-                if province == "Gauteng":
-                    value = 97.8  # Percentage of school-aged children enrolled
-                elif province == "Western Cape":
-                    value = 96.9
-                elif province == "Eastern Cape":
-                    value = 94.2
-                else:
-                    value = 95.3  # Default
-            
-            elif metric_type == "literacy_rate":
-                # Literacy rate data
-                if province == "Gauteng":
-                    value = 94.8  # Percentage of literate persons aged 15+
-                elif province == "Western Cape":
-                    value = 97.1
-                elif province == "Eastern Cape":
-                    value = 89.5
-                else:
-                    value = 92.3  # Default
-            
-            elif metric_type == "healthcare_access":
-                # Healthcare access data
-                if province == "Gauteng":
-                    value = 82.5  # Percentage with healthcare within 5km
-                elif province == "Western Cape":
-                    value = 86.2
-                elif province == "Eastern Cape":
-                    value = 64.9
-                else:
-                    value = 73.8  # Default
-            
-            elif metric_type == "grant_recipients":
-                # Social grant data
-                if province == "Gauteng":
-                    value = 31.2  # Percentage receiving social grants
-                elif province == "Western Cape":
-                    value = 25.8
-                elif province == "Eastern Cape":
-                    value = 41.9
-                else:
-                    value = 33.7  # Default
-            
-            else:
-                continue  # Skip unknown metrics
-            
-            data.append({
-                "region_code": region_code,
-                "metric_type": metric_type,
-                "value": value,
-                "unit": "%",
-                "date": "2019-07-01",  # Mid-year for annual data
-                "source": "Stats SA General Household Survey 2019",
-                "confidence": 0.95,
-                "description": description
-            })
-        
-        return pd.DataFrame(data)
+        # For this example, we'll serve prebuilt demonstration tables
+        return self._mock_metrics(_SOCIAL_TABLES, region_code, metric_types)
     
     async def fetch_governance_data(self, region_code, metric_types=None, start_date=None, end_date=None):
         """
@@ -309,66 +276,11 @@ class StatsSAFetcher(BaseESGFetcher):
         Returns:
             pandas.DataFrame: DataFrame with governance data
         """
-        logger.info(f"Fetching governance data for region {region_code}")
-        
+        logger.info("Fetching governance data for region %s", region_code)
+
         # In a real implementation, this would fetch and process data from Stats SA
-        # For this example, we'll generate data for demonstration purposes
-        data = []
-        
-        # Filter metric types
-        metrics = self.GOVERNANCE_METRICS
-        if metric_types:
-            metrics = {k: v for k, v in metrics.items() if k in metric_types}
-        
-        # Extract province code
-        province = self._get_province_from_code(region_code)
-        
-        # Handle date range
-        if not start_date:
-            start_date = "2019-01-01"
-        if not end_date:
-            end_date = "2019-12-31"
-        
-        # Add sample data for each metric
-        for metric_type, description in metrics.items():
-            # This would be replaced with actual data from Stats SA
-            if metric_type == "service_satisfaction":
-                # Service satisfaction data
-                if province == "Gauteng":
-                    value = 62.5  # Percentage satisfied with government services
-                elif province == "Western Cape":
-                    value = 68.7
-                elif province == "Eastern Cape":
-                    value = 48.9
-                else:
-                    value = 56.3  # Default
-            
-            elif metric_type == "municipal_performance":
-                # Municipal performance data
-                if province == "Gauteng":
-                    value = 58.2  # Percentage satisfied with local municipality
-                elif province == "Western Cape":
-                    value = 65.4
-                elif province == "Eastern Cape":
-                    value = 42.7
-                else:
-                    value = 52.8  # Default
-            
-            else:
-                continue  # Skip unknown metrics
-            
-            data.append({
-                "region_code": region_code,
-                "metric_type": metric_type,
-                "value": value,
-                "unit": "%",
-                "date": "2019-07-01",  # Mid-year for annual data
-                "source": "Stats SA Community Survey",
-                "confidence": 0.9,
-                "description": description
-            })
-        
-        return pd.DataFrame(data)
+        # For this example, we'll serve prebuilt demonstration tables
+        return self._mock_metrics(_GOVERNANCE_TABLES, region_code, metric_types)
     
     async def fetch_infrastructure_data(self, region_code, metric_types=None, start_date=None, end_date=None):
         """
@@ -383,89 +295,82 @@ class StatsSAFetcher(BaseESGFetcher):
         Returns:
             pandas.DataFrame: DataFrame with infrastructure data
         """
-        logger.info(f"Fetching infrastructure data for region {region_code}")
-        
+        logger.info("Fetching infrastructure data for region %s", region_code)
+
         # In a real implementation, this would fetch and process data from Stats SA
-        # For this example, we'll generate data for demonstration purposes
-        data = []
-        
-        # Filter metric types
-        metrics = self.INFRASTRUCTURE_METRICS
-        if metric_types:
-            metrics = {k: v for k, v in metrics.items() if k in metric_types}
-        
-        # Extract province code
+        # For this example, we'll serve prebuilt demonstration tables
+        return self._mock_metrics(_INFRASTRUCTURE_TABLES, region_code, metric_types)
+
+    def _mock_metrics(self, tables, region_code, metric_types):
+        """
+        Select the prebuilt mock table for a region and attach its code
+
+        Args:
+            tables (dict): Province -> prebuilt metrics DataFrame
+            region_code (str): Region code the records are attributed to
+            metric_types (list, optional): Metric types to keep, all if None
+
+        Returns:
+            pandas.DataFrame: Copy of the table, safe for callers to mutate
+        """
         province = self._get_province_from_code(region_code)
-        
-        # Handle date range
-        if not start_date:
-            start_date = "2019-01-01"
-        if not end_date:
-            end_date = "2019-12-31"
-        
-        # Add sample data for each metric
-        for metric_type, description in metrics.items():
-            # This would be replaced with actual data from Stats SA
-            if metric_type == "roads_paved":
-                # Paved roads data
-                if province == "Gauteng":
-                    value = 78.4  # Percentage with access to paved roads
-                elif province == "Western Cape":
-                    value = 82.9
-                elif province == "Eastern Cape":
-                    value = 41.5
-                else:
-                    value = 58.7  # Default
-            
-            elif metric_type == "telecommunications":
-                # Telecommunications data
-                if province == "Gauteng":
-                    value = 95.6  # Percentage with telecom access
-                elif province == "Western Cape":
-                    value = 96.8
-                elif province == "Eastern Cape":
-                    value = 86.3
-                else:
-                    value = 90.2  # Default
-            
-            elif metric_type == "schools_access":
-                # Schools access data
-                if province == "Gauteng":
-                    value = 87.5  # Percentage with school within 5km
-                elif province == "Western Cape":
-                    value = 89.2
-                elif province == "Eastern Cape":
-                    value = 65.4
-                else:
-                    value = 74.8  # Default
-            
-            elif metric_type == "clinics_access":
-                # Clinics access data
-                if province == "Gauteng":
-                    value = 82.5  # Percentage with clinic within 5km
-                elif province == "Western Cape":
-                    value = 86.2
-                elif province == "Eastern Cape":
-                    value = 64.9
-                else:
-                    value = 73.8  # Default
-            
-            else:
-                continue  # Skip unknown metrics
-            
-            data.append({
-                "region_code": region_code,
-                "metric_type": metric_type,
-                "value": value,
-                "unit": "%",
-                "date": "2019-07-01",  # Mid-year for annual data
-                "source": "Stats SA General Household Survey 2019",
-                "confidence": 0.95,
-                "description": description
-            })
-        
-        return pd.DataFrame(data)
-    
+        base = tables.get(province, tables["Unknown"])
+
+        if metric_types:
+            base = base[base["metric_type"].isin(metric_types)]
+
+        df = base.copy()
+        df.insert(0, "region_code", region_code)
+        return df
+
+    async def _cached_get(self, url):
+        """
+        GET a Stats SA resource through an on-disk cache
+
+        Publications like the GHS and Community Survey PDFs change rarely,
+        so bodies are stored in the fetcher cache directory with an ETag
+        sidecar and revalidated with a conditional request - a 304 serves
+        the multi-MB payload straight from disk. File I/O runs in worker
+        threads so it never blocks the event loop.
+
+        Args:
+            url (str): Absolute URL to fetch
+
+        Returns:
+            bytes: Response body
+        """
+        key = hashlib.sha1(url.encode()).hexdigest()
+        path = os.path.join(self.cache_dir, key)
+        etag_path = path + ".etag"
+
+        headers = {}
+        if os.path.exists(path) and os.path.exists(etag_path):
+            etag = (await asyncio.to_thread(_read_file, etag_path, "r")).strip()
+            if etag:
+                headers["If-None-Match"] = etag
+
+        try:
+            session = await self._get_session()
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    logger.info("Serving %s from cache", url)
+                    return await asyncio.to_thread(_read_file, path)
+
+                response.raise_for_status()
+                body = await response.read()
+
+            await asyncio.to_thread(_write_file, path, body)
+            etag = response.headers.get("ETag")
+            if etag:
+                await asyncio.to_thread(_write_file, etag_path, etag, "w")
+            return body
+        except aiohttp.ClientError as e:
+            # Prefer a stale cached copy over failing outright
+            if os.path.exists(path):
+                logger.warning("Fetching %s failed (%s), using cached copy", url, e)
+                return await asyncio.to_thread(_read_file, path)
+            raise
+
     def _get_province_from_code(self, region_code):
         """
         Extract province name from region code
@@ -476,16 +381,20 @@ class StatsSAFetcher(BaseESGFetcher):
         Returns:
             str: Province name
         """
-        code_to_province = {
-            "ZA-EC": "Eastern Cape",
-            "ZA-FS": "Free State",
-            "ZA-GT": "Gauteng",
-            "ZA-NL": "KwaZulu-Natal",
-            "ZA-LP": "Limpopo",
-            "ZA-MP": "Mpumalanga",
-            "ZA-NW": "North West",
-            "ZA-NC": "Northern Cape",
-            "ZA-WC": "Western Cape"
-        }
-        
-        return code_to_province.get(region_code, "Unknown")
\ No newline at end of file
+        return _CODE_TO_PROVINCE.get(region_code, "Unknown")
+
+
+# Per-province mock tables, one set per ESG dimension - constructed once at
+# import so each fetch call only looks up, filters and copies
+_ENV_TABLES = _build_metric_tables(
+    _ENVIRONMENTAL_VALUES, _ENVIRONMENTAL_METRICS,
+    "Stats SA General Household Survey 2019", 0.95)
+_SOCIAL_TABLES = _build_metric_tables(
+    _SOCIAL_VALUES, _SOCIAL_METRICS,
+    "Stats SA General Household Survey 2019", 0.95)
+_GOVERNANCE_TABLES = _build_metric_tables(
+    _GOVERNANCE_VALUES, _GOVERNANCE_METRICS,
+    "Stats SA Community Survey", 0.9)
+_INFRASTRUCTURE_TABLES = _build_metric_tables(
+    _INFRASTRUCTURE_VALUES, _INFRASTRUCTURE_METRICS,
+    "Stats SA General Household Survey 2019", 0.95)
\ No newline at end of file
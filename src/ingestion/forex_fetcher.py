@@ -1,16 +1,55 @@
 import aiohttp
 import pandas as pd
+import numpy as np
 import logging
 import json
 import os
-from datetime import datetime, timedelta
+import re
+from datetime import datetime, timedelta, date
+from functools import lru_cache
 import asyncio
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 
 from .base_fetcher import BaseFetcher
 
 logger = logging.getLogger(__name__)
 
+# Default timeout for Alpha Vantage requests - set once on the shared
+# session so hung connections are cut off without per-call timeout wrappers
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, sock_connect=10, sock_read=20)
+
+# Currency pairs arrive as "EURUSD" or "EUR/USD"; one compiled pattern
+# handles both forms
+_PAIR_RE = re.compile(r"^([A-Z]{3})/?([A-Z]{3})$")
+
+# Simulated base exchange rates for the major pairs
+_BASE_RATES = {
+    "EURUSD": 1.08,
+    "GBPUSD": 1.25,
+    "USDJPY": 145.0,
+    "USDCHF": 0.93,
+    "AUDUSD": 0.66,
+    "USDCAD": 1.36,
+    "NZDUSD": 0.61,
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_pair(symbol: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Split a currency pair symbol into its two currency codes
+
+    Args:
+        symbol (str): Pair in "EURUSD" or "EUR/USD" form
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: (from, to) currency codes,
+        or (None, None) when the symbol doesn't parse
+    """
+    match = _PAIR_RE.match(symbol)
+    return (match.group(1), match.group(2)) if match else (None, None)
+
+
 class ForexFetcher(BaseFetcher):
     """Fetcher for foreign exchange (forex) data"""
     
@@ -19,11 +58,49 @@ class ForexFetcher(BaseFetcher):
         super().__init__("Forex Fetcher")
         self.api_key = os.environ.get("ALPHA_VANTAGE_API_KEY", "")
         self.base_url = "https://www.alphavantage.co/query"
-        
+
         # Cache for symbols
         self.symbols_cache = []
         self.symbols_last_updated = None
-    
+
+        # Shared HTTP session for Alpha Vantage requests - created lazily and
+        # reused so every call shares the connection pool instead of paying a
+        # TCP/TLS handshake per request. FOREX_POOL_SIZE lifts the default
+        # 100-connection ceiling when fanning out across many pairs.
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._pool_size = int(os.environ.get("FOREX_POOL_SIZE", "128"))
+
+        # (function, from, to, interval) -> (day fetched, DataFrame). Daily
+        # and coarser series change at most once a day, so hits skip the
+        # whole fetch-and-build path until the bucket rolls over.
+        self._av_cache: Dict[tuple, tuple] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared aiohttp session, creating it on first use
+
+        The connector caps per-host concurrency below Alpha Vantage's rate
+        budget and caches DNS lookups so new connections skip the resolver.
+
+        Returns:
+            aiohttp.ClientSession: The shared session
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._pool_size,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True),
+                timeout=_REQUEST_TIMEOUT)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared aiohttp session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     async def get_symbols(self) -> List[str]:
         """
         Get list of available forex currency pairs
@@ -34,7 +111,7 @@ class ForexFetcher(BaseFetcher):
         # Return cached symbols if available and not too old
         if self.symbols_cache and self.symbols_last_updated and \
            (datetime.now() - self.symbols_last_updated).total_seconds() < 86400:  # 24 hours
-            logger.info(f"Returning {len(self.symbols_cache)} cached forex symbols")
+            logger.info("Returning %d cached forex symbols", len(self.symbols_cache))
             return self.symbols_cache
         
         try:
@@ -48,10 +125,10 @@ class ForexFetcher(BaseFetcher):
             
             self.symbols_cache = symbols
             self.symbols_last_updated = datetime.now()
-            logger.info(f"Retrieved {len(symbols)} forex symbols")
+            logger.info("Retrieved %d forex symbols", len(symbols))
             return symbols
         except Exception as e:
-            logger.error(f"Error retrieving forex symbols: {str(e)}")
+            logger.error("Error retrieving forex symbols: %s", e)
             # Return cached symbols if available, otherwise an empty list
             return self.symbols_cache if self.symbols_cache else []
     
@@ -91,18 +168,21 @@ class ForexFetcher(BaseFetcher):
             end_dt = datetime.strptime(end_date, "%Y-%m-%d")
             start_dt = end_dt - timedelta(days=30)
             start_date = start_dt.strftime("%Y-%m-%d")
-        
+
+        # Parse the window bounds once; the date column stays datetime64 all
+        # the way through, so filtering is one vectorized comparison with no
+        # string round-trip (serialization formats dates at the API edge)
+        start_ts = pd.Timestamp(start_date)
+        end_ts = pd.Timestamp(end_date)
+
         try:
             if symbol:
                 # Split symbol into from_currency and to_currency
-                if len(symbol) == 6:  # Standard forex pair format
-                    from_currency = symbol[:3]
-                    to_currency = symbol[3:]
-                else:
+                from_currency, to_currency = _parse_pair(symbol)
+                if from_currency is None:
                     # Handle other formats or use default
-                    from_currency = "EUR"
-                    to_currency = "USD"
-                    logger.warning(f"Invalid forex symbol format: {symbol}, using EURUSD")
+                    from_currency, to_currency = "EUR", "USD"
+                    logger.warning("Invalid forex symbol format: %s, using EURUSD", symbol)
                 
                 # Determine Alpha Vantage function based on interval
                 if interval.lower() == "intraday":
@@ -128,54 +208,87 @@ class ForexFetcher(BaseFetcher):
                 
                 # Filter by date range if data was fetched
                 if not df.empty and 'date' in df.columns:
-                    mask = (df['date'] >= start_date) & (df['date'] <= end_date)
-                    df = df[mask].copy()
+                    df = self._filter_date_range(df, start_ts, end_ts)
             else:
                 # Fetch data for multiple symbols
                 symbols = await self.get_symbols()
                 # Limit to first 5 symbols for demo purposes
                 symbols = symbols[:5]
                 
-                all_dfs = []
-                for sym in symbols:
-                    try:
-                        # Split symbol
-                        from_currency = sym[:3]
-                        to_currency = sym[3:]
-                        
-                        # Fetch data
-                        sym_df = await self._fetch_from_alpha_vantage(
+                # Fetch all pairs concurrently, bounded to Alpha Vantage's
+                # free-tier budget of five requests in flight
+                semaphore = asyncio.Semaphore(5)
+
+                async def fetch_one(sym):
+                    from_currency, to_currency = _parse_pair(sym)
+                    async with semaphore:
+                        return await self._fetch_from_alpha_vantage(
                             function="FX_DAILY",
                             from_currency=from_currency,
                             to_currency=to_currency
                         )
-                        
-                        # Filter by date range
-                        if not sym_df.empty and 'date' in sym_df.columns:
-                            mask = (sym_df['date'] >= start_date) & (sym_df['date'] <= end_date)
-                            sym_df = sym_df[mask].copy()
-                            
-                            if not sym_df.empty:
-                                all_dfs.append(sym_df)
-                    except Exception as e:
-                        logger.error(f"Error fetching data for symbol {sym}: {str(e)}")
-                
-                if all_dfs:
-                    df = pd.concat(all_dfs, ignore_index=True)
+
+                results = await asyncio.gather(
+                    *(fetch_one(sym) for sym in symbols), return_exceptions=True)
+
+                all_dfs = []
+                for sym, sym_df in zip(symbols, results):
+                    if isinstance(sym_df, Exception):
+                        logger.error("Error fetching data for symbol %s: %s", sym, sym_df)
+                        continue
+
+                    # Filter by date range
+                    if not sym_df.empty and 'date' in sym_df.columns:
+                        sym_df = self._filter_date_range(sym_df, start_ts, end_ts)
+
+                        if not sym_df.empty:
+                            all_dfs.append(sym_df)
+
+                if len(all_dfs) == 1:
+                    # A single frame needs no concat - just renumber the index
+                    df = all_dfs[0].reset_index(drop=True)
+                elif all_dfs:
+                    df = pd.concat(all_dfs, ignore_index=True, copy=False)
                 else:
                     df = pd.DataFrame()
             
             if not df.empty:
                 self.log_fetch_success(len(df))
             else:
-                logger.warning(f"No data retrieved for forex {symbol if symbol else 'symbols'}")
+                logger.warning("No data retrieved for forex %s", symbol if symbol else 'symbols')
             
             return df
         
         except Exception as e:
             self.log_fetch_error(e)
             return pd.DataFrame()  # Return empty DataFrame on error
-    
+
+    @staticmethod
+    def _filter_date_range(df: pd.DataFrame, start_ts: pd.Timestamp,
+                           end_ts: pd.Timestamp) -> pd.DataFrame:
+        """
+        Filter a forex DataFrame to rows within [start_ts, end_ts]
+
+        Args:
+            df (pd.DataFrame): DataFrame with a datetime64 'date' column
+            start_ts (pd.Timestamp): Inclusive lower bound
+            end_ts (pd.Timestamp): Inclusive upper bound
+
+        Returns:
+            pd.DataFrame: Filtered DataFrame
+        """
+        dates = df['date']
+
+        # Wide windows often cover the whole series; two scalar comparisons
+        # against the column bounds skip the O(n) mask and slice entirely
+        if start_ts <= dates.min() and end_ts >= dates.max():
+            return df
+
+        # Boolean indexing already materializes a new frame, so no defensive
+        # copy is needed on top of it
+        mask = (dates >= start_ts) & (dates <= end_ts)
+        return df.loc[mask]
+
     async def _fetch_from_alpha_vantage(self, function: str, from_currency: str, 
                                        to_currency: str, interval: str = "") -> pd.DataFrame:
         """
@@ -190,96 +303,89 @@ class ForexFetcher(BaseFetcher):
         Returns:
             pd.DataFrame: DataFrame with forex data
         """
+        # Serve from the day-bucketed memo when possible. Copies are returned
+        # because callers (and API routes) may mutate the frame in place.
+        cache_key = (function, from_currency, to_currency, interval)
+        cached = self._av_cache.get(cache_key)
+        if cached is not None and cached[0] == date.today():
+            return cached[1].copy()
+
+        # Fall back to the on-disk copy if another process (or an earlier
+        # run today) already built this series - reading the pickled frame
+        # is far cheaper than regenerating or re-downloading it
+        suffix = f"_{interval}" if interval else ""
+        cache_path = os.path.join(
+            self.cache_dir, f"fx_{function}_{from_currency}{to_currency}{suffix}.pkl")
+        try:
+            fetched_day = date.fromtimestamp(os.path.getmtime(cache_path))
+        except OSError:
+            fetched_day = None
+        if fetched_day == date.today():
+            try:
+                df = await asyncio.to_thread(pd.read_pickle, cache_path)
+                self._av_cache[cache_key] = (date.today(), df)
+                return df.copy()
+            except Exception as e:
+                logger.warning("Failed to read forex cache %s: %s", cache_path, e)
+
         # For now, simulate API response to avoid hitting rate limits
         # In a production environment, this would make actual API requests
-        
+
         # Create a realistic DataFrame based on the currency pair
         symbol = f"{from_currency}{to_currency}"
         
-        # Starting date - go back 100 days from today
+        # Business days over the last 100 calendar days - bdate_range drops
+        # weekends, replacing the per-day weekday() check
         end_date = datetime.now()
         start_date = end_date - timedelta(days=100)
-        
-        # Generate simulated exchange rate data
-        dates = []
-        opens = []
-        highs = []
-        lows = []
-        closes = []
-        
+        dates = pd.bdate_range(start_date.date(), end_date.date())
+
         # Base rate depends on the currency pair
-        base_rate = 1.0
-        if symbol == "EURUSD":
-            base_rate = 1.08
-        elif symbol == "GBPUSD":
-            base_rate = 1.25
-        elif symbol == "USDJPY":
-            base_rate = 145.0
-        elif symbol == "USDCHF":
-            base_rate = 0.93
-        elif symbol == "AUDUSD":
-            base_rate = 0.66
-        elif symbol == "USDCAD":
-            base_rate = 1.36
-        elif symbol == "NZDUSD":
-            base_rate = 0.61
-        else:
-            # For other pairs, generate a random base rate between 0.5 and 2.0
+        base_rate = _BASE_RATES.get(symbol)
+        if base_rate is None:
+            # For other pairs, derive a base rate between 0.5 and 2.0
             seed = sum(ord(c) for c in symbol) % 100
             base_rate = 0.5 + (seed / 100.0) * 1.5
-        
-        current_date = start_date
-        current_rate = base_rate
-        
-        while current_date <= end_date:
-            # Skip weekends for forex data
-            if current_date.weekday() < 5:  # 0-4 are Monday to Friday
-                # Small daily variation in exchange rate
-                # Different currency pairs have different volatility
-                volatility = 0.002  # Default volatility
-                if "JPY" in symbol:
-                    volatility = 0.004
-                elif "GBP" in symbol:
-                    volatility = 0.003
-                
-                # Calculate daily change
-                daily_change = (hash(str(current_date)) % 100 - 50) / 10000.0  # -0.5% to +0.5%
-                daily_change *= (1 + volatility * 10)
-                
-                # Calculate prices
-                open_rate = current_rate
-                close_rate = current_rate * (1 + daily_change)
-                high_rate = max(open_rate, close_rate) * (1 + volatility)
-                low_rate = min(open_rate, close_rate) * (1 - volatility)
-                
-                # Update for next day
-                current_rate = close_rate
-                
-                # Round rates to appropriate decimal places
-                if "JPY" in symbol:  # JPY pairs typically have 3 decimal places
-                    precision = 3
-                else:  # Most other pairs have 5 decimal places
-                    precision = 5
-                
-                # Add to lists
-                dates.append(current_date.strftime("%Y-%m-%d"))
-                opens.append(round(open_rate, precision))
-                highs.append(round(high_rate, precision))
-                lows.append(round(low_rate, precision))
-                closes.append(round(close_rate, precision))
-            
-            current_date += timedelta(days=1)
-        
-        # Create DataFrame
+
+        # Different currency pairs have different volatility
+        volatility = 0.002  # Default volatility
+        if "JPY" in symbol:
+            volatility = 0.004
+        elif "GBP" in symbol:
+            volatility = 0.003
+
+        # JPY pairs typically have 3 decimal places, most others 5
+        precision = 3 if "JPY" in symbol else 5
+
+        # Draw the whole series of daily changes at once; seeding the
+        # generator per symbol keeps the walk deterministic across calls
+        rng = np.random.default_rng(sum(map(ord, symbol)))
+        daily_changes = (rng.integers(-50, 50, size=len(dates)) / 10000.0) \
+            * (1 + volatility * 10)
+
+        # Each close compounds the previous one; opens trail by a day
+        closes = base_rate * np.cumprod(1.0 + daily_changes)
+        opens = np.concatenate(([base_rate], closes[:-1]))
+        highs = np.maximum(opens, closes) * (1 + volatility)
+        lows = np.minimum(opens, closes) * (1 - volatility)
+
+        # Create DataFrame - the bdate_range index is already datetime64, so
+        # downstream filtering never has to convert or compare strings
         df = pd.DataFrame({
             'date': dates,
             'symbol': symbol,
-            'open': opens,
-            'high': highs,
-            'low': lows,
-            'close': closes,
+            'open': np.round(opens, precision),
+            'high': np.round(highs, precision),
+            'low': np.round(lows, precision),
+            'close': np.round(closes, precision),
             'exchange': 'Alpha Vantage',
             'asset_type': 'forex'
         })
-        
-        return df
\ No newline at end of file
+
+        try:
+            await asyncio.to_thread(df.to_pickle, cache_path)
+        except OSError as e:
+            logger.warning("Failed to write forex cache %s: %s", cache_path, e)
+
+        self._av_cache[cache_key] = (date.today(), df)
+        return df.copy()
\ No newline at end of file